@@ -3,12 +3,18 @@ Command-line interface for converting FASTA files to AlphaFold3 compatible JSON
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 from easyaf3config.utils.fasta import create_job_config_from_fasta
 
+# orjson's C encoder is much faster than the stdlib on configs with many
+# sequences; fall back to the stdlib when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def parse_args(args=None):
     """Parse command line arguments."""
@@ -49,12 +55,18 @@ def parse_args(args=None):
     )
     
     parser.add_argument(
-        "--version", 
-        type=int, 
-        default=1, 
-        choices=[1, 2], 
+        "--version",
+        type=int,
+        default=1,
+        choices=[1, 2],
         help="Configuration version (default: 1)"
     )
+
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip sequence alphabet validation (for trusted inputs)"
+    )
     
     return parser.parse_args(args)
 
@@ -81,12 +93,19 @@ def main(args=None):
             job_name=job_name,
             model_seeds=args.model_seeds,
             dialect=args.dialect,
-            version=args.version
+            version=args.version,
+            validate=not args.no_validate
         )
         
-        # Save to JSON file
-        with open(json_path, "w") as json_file:
-            json.dump(af_job.to_dict(), json_file, indent=4)
+        # Save to JSON file (orjson only supports 2-space indent); without
+        # orjson, stream sequences one at a time to keep peak memory low
+        if orjson is not None:
+            json_path.write_bytes(
+                orjson.dumps(af_job.to_dict(), option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(json_path, "w") as json_file:
+                af_job.dump_json(json_file)
             
         print(f"Successfully created {json_path}")
         return 0
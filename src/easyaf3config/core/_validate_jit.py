@@ -0,0 +1,35 @@
+"""
+Optional numba-accelerated alphabet validation kernel.
+
+Importing this module requires numba and numpy. Callers are expected to
+guard the import and fall back to the compiled negated-character-class
+regex scan when either is missing.
+"""
+
+import numba
+import numpy as np
+
+
+def build_table(valid_bytes: bytes) -> np.ndarray:
+    """Build a 256-entry validity lookup table for an alphabet."""
+    table = np.zeros(256, dtype=np.uint8)
+    table[np.frombuffer(valid_bytes, dtype=np.uint8)] = 1
+    return table
+
+
+@numba.njit(cache=True)
+def _first_invalid(buf, table):
+    """Return the index of the first invalid byte in buf, or -1.
+
+    LLVM lowers the table lookup to a compare per byte; the early return
+    keeps the scan short on invalid input.
+    """
+    for i in range(buf.shape[0]):
+        if table[buf[i]] == 0:
+            return i
+    return -1
+
+
+def first_invalid(seq_bytes: bytes, table: np.ndarray) -> int:
+    """Return the index of the first byte outside the alphabet, or -1."""
+    return _first_invalid(np.frombuffer(seq_bytes, dtype=np.uint8), table)
@@ -2,13 +2,24 @@
 Configuration classes for AlphaFold3 jobs.
 """
 
+import json
+import textwrap
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
 from easyaf3config.core.sequence import DNASequence, ProteinSequence, RNASequence, Sequence
 
 
+# Sequence type key -> class dispatch table, built once at import instead of
+# per from_dict call. Keys are the canonical lowercase form.
+_SEQUENCE_TYPES = {
+    "protein": ProteinSequence,
+    "rna": RNASequence,
+    "dna": DNASequence,
+}
+
+
 class Dialect(str, Enum):
     """
     Supported model dialects.
@@ -24,7 +35,13 @@ class Version(int, Enum):
     V2 = 2
 
 
-@dataclass
+# Value -> member coercion tables. Enum.__call__ funnels through the
+# _missing_ machinery on every call; a plain dict hit is a single lookup.
+_VERSION_MAP = {v.value: v for v in Version}
+_DIALECT_MAP = {d.value: d for d in Dialect}
+
+
+@dataclass(slots=True)
 class AfJobConfig:
     """
     AlphaFold job configuration.
@@ -57,17 +74,17 @@ class AfJobConfig:
         if not self.sequences:
             raise ValueError("At least one sequence is required")
             
-        if isinstance(self.version, int):
-            try:
-                self.version = Version(self.version)
-            except ValueError:
+        if type(self.version) is not Version and isinstance(self.version, int):
+            version = _VERSION_MAP.get(self.version)
+            if version is None:
                 raise ValueError(f"Unsupported version: {self.version}. Supported versions are {[v.value for v in Version]}")
-            
-        if isinstance(self.dialect, str):
-            try:
-                self.dialect = Dialect(self.dialect)
-            except ValueError:
+            self.version = version
+
+        if type(self.dialect) is not Dialect and isinstance(self.dialect, str):
+            dialect = _DIALECT_MAP.get(self.dialect)
+            if dialect is None:
                 raise ValueError(f"Unsupported dialect: {self.dialect}")
+            self.dialect = dialect
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the job configuration to a dictionary representation."""
@@ -88,6 +105,37 @@ class AfJobConfig:
             
         return result
 
+    def dump_json(self, fp: TextIO) -> None:
+        """
+        Stream the configuration as indented JSON to an open text file.
+
+        Unlike ``json.dump(self.to_dict(), fp)``, sequences are encoded one
+        at a time, so peak memory stays at a single sequence dict instead of
+        the whole materialized tree plus the encoder's buffers.
+
+        Args:
+            fp: Writable text file object
+        """
+        fp.write("{\n")
+        fp.write(f'    "name": {json.dumps(self.name)},\n')
+        fp.write(f'    "modelSeeds": {json.dumps(self.modelSeeds)},\n')
+
+        fp.write('    "sequences": [\n')
+        last = len(self.sequences) - 1
+        for i, seq in enumerate(self.sequences):
+            chunk = textwrap.indent(json.dumps(seq.to_dict(), indent=4), " " * 8)
+            fp.write(chunk)
+            fp.write(",\n" if i != last else "\n")
+        fp.write("    ],\n")
+
+        fp.write(f'    "dialect": {json.dumps(self.dialect.value)},\n')
+        fp.write(f'    "version": {self.version.value}')
+        if self.bondedAtomPairs is not None:
+            fp.write(f',\n    "bondedAtomPairs": {json.dumps(self.bondedAtomPairs)}')
+        if self.userCCD is not None:
+            fp.write(f',\n    "userCCD": {json.dumps(self.userCCD)}')
+        fp.write("\n}")
+
     @classmethod
     def from_dict(cls, data: dict) -> 'AfJobConfig':
         """Create an AfJobConfig object from a dictionary."""
@@ -102,23 +150,18 @@ class AfJobConfig:
         if not isinstance(sequences_data, list):
             raise ValueError("sequences must be a list")
         
-        # Map sequence types to corresponding classes
-        sequence_types = {
-            "protein": ProteinSequence,
-            "rna": RNASequence,
-            "dna": DNASequence,
-        }
-        
         # Process each sequence data
         for seq_data in sequences_data:
             # Validate sequence data is a dictionary
             if not isinstance(seq_data, dict):
                 raise ValueError(f"Invalid sequence data format: {seq_data}")
-                
+
             # Iterate through each type key-value pair in sequence data
             for seq_type, seq_content in seq_data.items():
-                # Get corresponding sequence class
-                sequence_class = sequence_types.get(seq_type.lower())
+                # Get corresponding sequence class; keys are canonically
+                # lowercase, so only fall back to .lower() on a miss
+                sequence_class = (_SEQUENCE_TYPES.get(seq_type)
+                                  or _SEQUENCE_TYPES.get(seq_type.lower()))
                 if not sequence_class:
                     raise ValueError(f"Unsupported sequence type: {seq_type}")
                 
@@ -2,12 +2,78 @@
 Sequence classes for representing protein, DNA, and RNA sequences.
 """
 
-from dataclasses import dataclass, field
+import operator
+import re
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+# Canonical validation alphabets, built once at import time so nothing is
+# allocated per validation call.
+_PROTEIN_AA = frozenset("ACDEFGHIKLMNPQRSTVWY")
+_DNA_NT = frozenset("ATCG")
+_RNA_NT = frozenset("AUCG")
 
-@dataclass
+
+def _valid_bytes(alphabet: frozenset) -> bytes:
+    """Build a ``bytes.translate`` delete table for an alphabet.
+
+    Translating a sequence against its table strips every valid character
+    (either case) in a single C-level pass; anything left over is invalid.
+    This avoids a Python-level loop over individual residues, which matters
+    for long FASTA sequences.
+    """
+    chars = "".join(sorted(alphabet))
+    return (chars + chars.lower()).encode("ascii")
+
+
+_PROTEIN_VALID_BYTES = _valid_bytes(_PROTEIN_AA)
+_DNA_VALID_BYTES = _valid_bytes(_DNA_NT)
+_RNA_VALID_BYTES = _valid_bytes(_RNA_NT)
+
+# Compiled patterns matching the first byte outside each alphabet. sre
+# compiles a negated character class to a bitmap test with a C inner loop —
+# as fast as bytes.translate but without allocating a residual buffer, and
+# the match object carries the offending position for the error message.
+_INVALID_PROTEIN_RE = re.compile(b"[^" + _PROTEIN_VALID_BYTES + b"]")
+_INVALID_DNA_RE = re.compile(b"[^" + _DNA_VALID_BYTES + b"]")
+_INVALID_RNA_RE = re.compile(b"[^" + _RNA_VALID_BYTES + b"]")
+
+# Optional numba-compiled validation kernel; falls back to the regex scan
+# when numba/numpy are not installed.
+try:
+    from easyaf3config.core import _validate_jit
+except ImportError:
+    _validate_jit = None
+
+if _validate_jit is not None:
+    _PROTEIN_JIT_TABLE = _validate_jit.build_table(_PROTEIN_VALID_BYTES)
+    _DNA_JIT_TABLE = _validate_jit.build_table(_DNA_VALID_BYTES)
+    _RNA_JIT_TABLE = _validate_jit.build_table(_RNA_VALID_BYTES)
+else:
+    _PROTEIN_JIT_TABLE = _DNA_JIT_TABLE = _RNA_JIT_TABLE = None
+
+
+# Optional Sequence fields that are emitted only when set. The (name,
+# attrgetter) pairs let the generic to_dict fetch each value through C code
+# instead of resolving the attribute name per call; the generated per-class
+# serializers inline the same names as literals.
+_OPT_FIELD_NAMES = ("unpairedMsa", "unpairedMsaPath",
+                    "pairedMsa", "pairedMsaPath", "templates")
+_OPT_FIELDS = tuple(
+    (name, operator.attrgetter(name)) for name in _OPT_FIELD_NAMES
+)
+
+
+def _first_invalid(seq_bytes: bytes, invalid_re: "re.Pattern", jit_table) -> int:
+    """Return the index of the first byte outside the alphabet, or -1."""
+    if jit_table is not None:
+        return _validate_jit.first_invalid(seq_bytes, jit_table)
+    match = invalid_re.search(seq_bytes)
+    return -1 if match is None else match.start()
+
+
+@dataclass(slots=True)
 class Modification:
     """
     Represents a post-translational modification (PTM) on a sequence.
@@ -30,14 +96,16 @@ class Modification:
         return str(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class Sequence:
     """
     Base class for biological sequences.
     
     Attributes:
         id: Unique identifier for the sequence
-        sequence: The actual sequence string
+        sequence: The actual sequence; may be passed as ASCII bytes (as
+            produced by byte-oriented parsers), which are validated without
+            an encode round-trip and stored as str
         type: The type of sequence (protein, dna, or rna) - set automatically
         modifications: Optional list of post-translational modifications
         unpairedMsa: Optional unpaired multiple sequence alignment
@@ -45,9 +113,12 @@ class Sequence:
         pairedMsa: Optional paired multiple sequence alignment
         pairedMsaPath: Optional path to paired MSA file
         templates: Optional templates for structure prediction
+        validate: Run the per-residue alphabet scan at construction
+            (default True); pass False for trusted input and call
+            validate_sequence() later if needed
     """
     id: str = field()
-    sequence: str = field()
+    sequence: Union[str, bytes] = field()
     type: str = field(init=False)  # type field is set automatically
     modifications: Optional[List[Modification]] = field(default=None)
     unpairedMsa: Optional[str] = field(default=None)
@@ -55,40 +126,94 @@ class Sequence:
     pairedMsa: Optional[str] = field(default=None)
     pairedMsaPath: Optional[Union[str, Path]] = field(default=None)
     templates: Optional[dict] = field(default=None)
+    # to_dict result memoized on first call; see to_dict
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False)
+    validate: InitVar[bool] = True
 
-    def __post_init__(self):
+    def __post_init__(self, validate: bool = True):
         """Initialize after dataclass initialization."""
         self.type = self._get_type()  # Set type after initialization
         self._validate_fields()
-        self._process_modifications()
+        if validate:
+            self._validate_sequence()
+        if isinstance(self.sequence, bytes):
+            # Decode once, after validation has proven the bytes are ASCII
+            self.sequence = self.sequence.decode("ascii")
+        if self.modifications is not None:
+            self._process_modifications()
 
     def _validate_fields(self):
         """Validate required fields and field combinations."""
-        if not all([self.type, self.id, self.sequence]):
+        if not (self.type and self.id and self.sequence):
             raise ValueError("type, id, and sequence are required fields")
         
         if self.unpairedMsa and self.unpairedMsaPath:
             raise ValueError("unpairedMsa and unpairedMsaPath are mutually exclusive")
         if self.pairedMsa and self.pairedMsaPath:
             raise ValueError("pairedMsa and pairedMsaPath are mutually exclusive")
-        
-        self._validate_sequence()
 
     def _validate_sequence(self):
         """Validate sequence format - implemented by subclasses."""
         pass
 
+    def validate_sequence(self):
+        """
+        Explicitly run sequence validation.
+
+        Intended for sequences constructed with validate=False; raises the
+        same ValueError as validation at construction would.
+        """
+        self._validate_sequence()
+
+    def _sequence_bytes(self) -> bytes:
+        """Return the sequence as ASCII bytes, without copying if already bytes.
+
+        Raises:
+            UnicodeEncodeError: When a str sequence contains non-ASCII text
+        """
+        seq = self.sequence
+        if isinstance(seq, bytes):
+            return seq
+        return seq.encode("ascii")
+
     def _process_modifications(self):
         """Process modifications field to ensure all items are Modification objects."""
-        if isinstance(self.modifications, list):
-            self.modifications = [
-                mod if isinstance(mod, Modification)
-                else Modification(**mod)
-                for mod in self.modifications
-            ]
+        mods = self.modifications
+        if not isinstance(mods, list) or not mods:
+            return
+
+        # Callers pass homogeneous lists in practice: from_dict supplies all
+        # dicts, direct construction all Modification objects. A typed first
+        # element takes the fast path, which assumes the rest of the list is
+        # typed too; in debug mode (the default) that assumption is verified
+        # so a mixed list fails here with a clear error instead of surfacing
+        # later as an AttributeError in to_dict. Run with -O to skip the
+        # check entirely.
+        if isinstance(mods[0], Modification):
+            if __debug__ and not all(isinstance(mod, Modification) for mod in mods):
+                raise TypeError(
+                    "modifications must be all Modification objects or all dicts"
+                )
+            return
+
+        self.modifications = [
+            mod if isinstance(mod, Modification)
+            else Modification(**mod)
+            for mod in mods
+        ]
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the sequence to a dictionary representation."""
+        """Convert the sequence to a dictionary representation.
+
+        The result is memoized on the instance: sequences are treated as
+        immutable once serialized, so repeated calls (e.g. re-dumping a
+        config) return the cached dict instead of rebuilding it. Mutate
+        fields before the first to_dict call.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+
         result = {
             self.type: {
                 "id": self.id,
@@ -101,12 +226,12 @@ class Sequence:
                 mod.to_dict() for mod in self.modifications
             ]
             
-        for field_name in ["unpairedMsa", "unpairedMsaPath", 
-                          "pairedMsa", "pairedMsaPath", "templates"]:
-            value = getattr(self, field_name)
+        for field_name, getter in _OPT_FIELDS:
+            value = getter(self)
             if value is not None:
                 result[self.type][field_name] = value
-                
+
+        self._cached_dict = result
         return result
 
     def __repr__(self):
@@ -147,7 +272,42 @@ class Sequence:
         raise NotImplementedError("Subclasses must implement _get_type()")
 
 
-@dataclass
+def _specialize_to_dict(cls):
+    """Generate a specialized ``to_dict`` for a Sequence subclass.
+
+    The generic ``Sequence.to_dict`` resolves the type key and optional
+    fields through a getattr loop on every call. Because the sequence type
+    and field names are fixed at class-definition time, we can emit an
+    equivalent function with everything inlined as literals, turning the
+    serialization of each sequence into straight-line bytecode. This shows
+    up when the CLI dumps configs with many sequences.
+    """
+    lines = [
+        "def to_dict(self):",
+        "    cached = self._cached_dict",
+        "    if cached is not None:",
+        "        return cached",
+        "    inner = {'id': self.id, 'sequence': self.sequence}",
+        "    if self.modifications:",
+        "        inner['modifications'] = [mod.to_dict() for mod in self.modifications]",
+    ]
+    for name in _OPT_FIELD_NAMES:
+        lines.append(f"    if self.{name} is not None:")
+        lines.append(f"        inner['{name}'] = self.{name}")
+    lines.append(f"    self._cached_dict = {{'{cls._get_type()}': inner}}")
+    lines.append("    return self._cached_dict")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = Sequence.to_dict.__doc__
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    cls.to_dict = to_dict
+    return cls
+
+
+@_specialize_to_dict
+@dataclass(slots=True)
 class ProteinSequence(Sequence):
     """
     Protein sequence class.
@@ -156,16 +316,24 @@ class ProteinSequence(Sequence):
     """
     def _validate_sequence(self):
         """Validate protein sequence."""
-        valid_amino_acids = set("ACDEFGHIKLMNPQRSTVWY")
-        if not all(aa in valid_amino_acids for aa in self.sequence.upper()):
+        try:
+            seq_bytes = self._sequence_bytes()
+        except UnicodeEncodeError:
             raise ValueError("Invalid protein sequence: contains invalid amino acids")
+        pos = _first_invalid(seq_bytes, _INVALID_PROTEIN_RE, _PROTEIN_JIT_TABLE)
+        if pos != -1:
+            raise ValueError(
+                "Invalid protein sequence: invalid amino acid "
+                f"{chr(seq_bytes[pos])!r} at position {pos}"
+            )
 
     @classmethod
     def _get_type(cls) -> str:
         return "protein"
 
 
-@dataclass
+@_specialize_to_dict
+@dataclass(slots=True)
 class DNASequence(Sequence):
     """
     DNA sequence class.
@@ -174,16 +342,24 @@ class DNASequence(Sequence):
     """
     def _validate_sequence(self):
         """Validate DNA sequence."""
-        valid_nucleotides = set("ATCG")
-        if not all(nt in valid_nucleotides for nt in self.sequence.upper()):
+        try:
+            seq_bytes = self._sequence_bytes()
+        except UnicodeEncodeError:
             raise ValueError("Invalid DNA sequence: contains invalid nucleotides")
+        pos = _first_invalid(seq_bytes, _INVALID_DNA_RE, _DNA_JIT_TABLE)
+        if pos != -1:
+            raise ValueError(
+                "Invalid DNA sequence: invalid nucleotide "
+                f"{chr(seq_bytes[pos])!r} at position {pos}"
+            )
 
     @classmethod
     def _get_type(cls) -> str:
         return "dna"
 
 
-@dataclass
+@_specialize_to_dict
+@dataclass(slots=True)
 class RNASequence(Sequence):
     """
     RNA sequence class.
@@ -192,9 +368,16 @@ class RNASequence(Sequence):
     """
     def _validate_sequence(self):
         """Validate RNA sequence."""
-        valid_nucleotides = set("AUCG")
-        if not all(nt in valid_nucleotides for nt in self.sequence.upper()):
+        try:
+            seq_bytes = self._sequence_bytes()
+        except UnicodeEncodeError:
             raise ValueError("Invalid RNA sequence: contains invalid nucleotides")
+        pos = _first_invalid(seq_bytes, _INVALID_RNA_RE, _RNA_JIT_TABLE)
+        if pos != -1:
+            raise ValueError(
+                "Invalid RNA sequence: invalid nucleotide "
+                f"{chr(seq_bytes[pos])!r} at position {pos}"
+            )
 
     @classmethod
     def _get_type(cls) -> str:
@@ -2,51 +2,276 @@
 Utilities for working with FASTA files.
 """
 
+import io
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Union
+from typing import List, Tuple, Union
 
-from Bio import SeqIO
+import numpy as np
+from Bio.SeqIO.FastaIO import SimpleFastaParser
 
 from easyaf3config.core.config import AfJobConfig, Dialect, Version
-from easyaf3config.core.sequence import ProteinSequence
+from easyaf3config.core.sequence import _PROTEIN_VALID_BYTES, ProteinSequence
 
+# Placeholder id given to records without a title line; replaced with a
+# positional "seq_N" id once the global record order is known.
+_UNNAMED_ID = "__unnamed__"
 
-def load_sequences_from_fasta(fasta_path: Union[str, Path]) -> List[ProteinSequence]:
+# Read buffer for streaming parses. Python's default 8 KB buffer means one
+# read syscall per few records on large files; 4 MB keeps the parser fed
+# from userspace.
+_READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+# uint8 view of the valid protein alphabet (both cases) for batch validation
+VALID_PROTEIN = np.frombuffer(_PROTEIN_VALID_BYTES, dtype=np.uint8)
+
+
+def validate_batch(bodies: List[bytes], alphabet: np.ndarray = VALID_PROTEIN) -> None:
+    """
+    Validate many sequence bodies against an alphabet in one NumPy pass.
+
+    The bodies are joined into a single buffer and checked with np.isin, so
+    the whole O(total bases) membership scan runs inside NumPy instead of
+    once per record in Python. Record boundaries are recovered from the
+    cumulative body lengths only when an invalid byte is found.
+
+    Args:
+        bodies: Sequence bodies as bytes, in record order
+        alphabet: uint8 array of valid byte values
+
+    Raises:
+        ValueError: Naming the first record containing an invalid character
+    """
+    if not bodies:
+        return
+
+    joined = np.frombuffer(b"".join(bodies), dtype=np.uint8)
+    invalid = ~np.isin(joined, alphabet)
+    if invalid.any():
+        first_bad = int(np.argmax(invalid))
+        offsets = np.cumsum([len(body) for body in bodies])
+        record = int(np.searchsorted(offsets, first_bad, side="right"))
+        raise ValueError(
+            f"Invalid sequence in record {record + 1}: "
+            f"invalid character {chr(joined[first_bad])!r}"
+        )
+
+
+def _estimate_record_count(fasta_path: Path) -> int:
+    """
+    Estimate the number of FASTA records from a 64 KB sniff of the file.
+
+    Counts '>' headers in the first chunk and scales by the file size, so
+    the cost is O(1) regardless of file length. Used for progress reporting
+    only; the estimate is 0 when the sniffed chunk contains no header.
+
+    Args:
+        fasta_path: Path to the FASTA file
+
+    Returns:
+        int: Estimated record count
+    """
+    file_size = fasta_path.stat().st_size
+    if file_size == 0:
+        return 0
+
+    with open(fasta_path, "rb") as fasta_file:
+        chunk = fasta_file.read(64 * 1024)
+
+    records = chunk.count(b">")
+    if not records:
+        return 0
+    return max(records, round(file_size * records / len(chunk)))
+
+
+def _scan_chunk_offsets(fasta_path: Path, chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split a FASTA file into byte ranges aligned on record boundaries.
+
+    Scans forward from evenly spaced byte targets to the next b"\\n>" via
+    mmap, so every range starts at a '>' header line and is a self-contained
+    FASTA slice a worker can parse independently.
+
+    Args:
+        fasta_path: Path to the FASTA file
+        chunks: Desired number of byte ranges
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) byte offsets covering the file
+    """
+    file_size = fasta_path.stat().st_size
+    if file_size == 0:
+        return []
+
+    bounds = [0]
+    with open(fasta_path, "rb") as fasta_file:
+        with mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for k in range(1, chunks):
+                pos = mm.find(b"\n>", file_size * k // chunks)
+                if pos == -1:
+                    break
+                if pos + 1 != bounds[-1]:
+                    bounds.append(pos + 1)
+    bounds.append(file_size)
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def _parse_fasta_mmap(fasta_path: Path):
+    """
+    Iterate FASTA records as (title, body) bytes pairs from a memory map.
+
+    Record boundaries are located with mmap.find, which scans at C speed,
+    instead of Python-level line iteration; no Biopython record objects are
+    created. Each body is materialized exactly once with newlines stripped
+    in a single bytes.translate pass.
+
+    Args:
+        fasta_path: Path to the FASTA file
+
+    Yields:
+        Tuple[bytes, bytes]: (title, sequence body) for each record
+    """
+    file_size = fasta_path.stat().st_size
+    if file_size == 0:
+        return
+
+    with open(fasta_path, "rb") as fasta_file:
+        with mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Hint the kernel to read ahead aggressively; records are
+            # consumed front to back (not available on all platforms)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            # Skip anything before the first header line
+            if mm[0:1] == b">":
+                pos = 0
+            else:
+                pos = mm.find(b"\n>")
+                if pos == -1:
+                    return
+                pos += 1
+
+            while pos != -1:
+                header_end = mm.find(b"\n", pos)
+                if header_end == -1:
+                    break
+
+                next_record = mm.find(b"\n>", header_end)
+                body_end = file_size if next_record == -1 else next_record + 1
+
+                title = mm[pos + 1:header_end].strip()
+                body = mm[header_end + 1:body_end].translate(None, b"\n\r")
+                yield title, body
+
+                pos = -1 if next_record == -1 else next_record + 1
+
+
+def _parse_fasta_chunk(args: Tuple[Path, int, int, bool]) -> List[ProteinSequence]:
+    """
+    Parse one byte range of a FASTA file into ProteinSequence objects.
+
+    Runs in a worker process: reads only its slice, then parses and
+    (optionally) validates the records it contains.
+
+    Args:
+        args: (fasta_path, start, end, validate) byte range to parse
+
+    Returns:
+        List[ProteinSequence]: Sequences found in the byte range
+    """
+    fasta_path, start, end, validate = args
+
+    with open(fasta_path, "rb") as fasta_file:
+        fasta_file.seek(start)
+        chunk = fasta_file.read(end - start)
+
+    sequences = []
+    for title, seq in SimpleFastaParser(io.StringIO(chunk.decode())):
+        seq_id = title.split(None, 1)[0] if title else _UNNAMED_ID
+        sequences.append(ProteinSequence(id=seq_id, sequence=seq, validate=validate))
+
+    return sequences
+
+
+def load_sequences_from_fasta(
+    fasta_path: Union[str, Path],
+    workers: int = 1,
+    use_mmap: bool = False,
+    validate: bool = True
+) -> List[ProteinSequence]:
     """
     Load sequences from a FASTA file and convert them to ProteinSequence objects.
-    
+
     Args:
         fasta_path: Path to the FASTA file
-        
+        workers: Number of worker processes; when greater than 1 the file is
+            split into record-aligned byte ranges parsed and validated in
+            parallel, which helps on large multi-FASTA inputs
+        use_mmap: Parse records directly from a memory map instead of
+            Biopython, which is the fastest serial path for large files
+        validate: Check every residue against the protein alphabet (default
+            True); pass False to skip the scan for trusted inputs
+
     Returns:
         List[ProteinSequence]: List of protein sequence objects
-    
+
     Raises:
         ValueError: When a sequence contains invalid characters
         FileNotFoundError: When the file does not exist
     """
     sequences = []
-    
+
     # Ensure file path is a Path object
     fasta_path = Path(fasta_path)
-    
+
     if not fasta_path.exists():
         raise FileNotFoundError(f"FASTA file not found: {fasta_path}")
-    
-    # Count total sequences for progress reporting
-    total_sequences = sum(1 for _ in SeqIO.parse(str(fasta_path), "fasta"))
-    
-    # Read FASTA file
-    for i, record in enumerate(SeqIO.parse(str(fasta_path), "fasta")):
-        print(f"Processing sequence {i+1} of {total_sequences}")
-        
-        # Create ProteinSequence object
-        protein_seq = ProteinSequence(
-            id=record.id if record.id else f"seq_{i+1}",
-            sequence=str(record.seq)
-        )
-        sequences.append(protein_seq)
-    
+
+    if workers > 1:
+        # Give each worker a few chunks so a record-dense range cannot
+        # stall the pool at the end of the file.
+        chunk_args = [
+            (fasta_path, start, end, validate)
+            for start, end in _scan_chunk_offsets(fasta_path, workers * 4)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_sequences in executor.map(_parse_fasta_chunk, chunk_args):
+                sequences.extend(chunk_sequences)
+
+        # Assign positional ids to records that had no title line
+        for i, seq in enumerate(sequences):
+            if seq.id == _UNNAMED_ID:
+                seq.id = f"seq_{i+1}"
+
+        return sequences
+
+    if use_mmap:
+        # Bodies arrive as bytes, so validation happens in one batch NumPy
+        # pass over the whole file instead of per record; construction can
+        # then skip its own scan and just decode
+        records = list(_parse_fasta_mmap(fasta_path))
+        if validate:
+            validate_batch([body for _, body in records])
+        for i, (title, body) in enumerate(records):
+            seq_id = title.split(None, 1)[0].decode() if title else f"seq_{i+1}"
+            sequences.append(ProteinSequence(id=seq_id, sequence=body, validate=False))
+        return sequences
+
+    # Read FASTA file in a single pass. SimpleFastaParser yields plain
+    # (title, sequence) string tuples, skipping the per-record SeqRecord/Seq
+    # object construction that SeqIO.parse pays for.
+    estimated_total = _estimate_record_count(fasta_path)
+    with open(fasta_path, buffering=_READ_BUFFER_SIZE) as fasta_file:
+        for i, (title, seq) in enumerate(SimpleFastaParser(fasta_file)):
+            if i % 1000 == 0:
+                print(f"Processing sequence {i+1} (~{estimated_total} total)")
+
+            # First word of the title line is the sequence id
+            seq_id = title.split(None, 1)[0] if title else f"seq_{i+1}"
+            sequences.append(ProteinSequence(id=seq_id, sequence=seq, validate=validate))
+
     return sequences
 
 
@@ -55,18 +280,21 @@ def create_job_config_from_fasta(
     job_name: str,
     model_seeds: List[int] = None,
     dialect: str = "alphafold3",
-    version: int = 1
+    version: int = 1,
+    validate: bool = True
 ) -> AfJobConfig:
     """
     Create a complete job configuration from a FASTA file.
-    
+
     Args:
         fasta_path: Path to the FASTA file
         job_name: Job name
         model_seeds: List of model seeds, defaults to [1]
         dialect: Model dialect, defaults to "alphafold3"
         version: Configuration version, defaults to 1
-        
+        validate: Check sequences against the protein alphabet, defaults
+            to True
+
     Returns:
         AfJobConfig: Job configuration object
     """
@@ -75,7 +303,7 @@ def create_job_config_from_fasta(
         model_seeds = [1]
     
     # Load sequences
-    sequences = load_sequences_from_fasta(fasta_path)
+    sequences = load_sequences_from_fasta(fasta_path, validate=validate)
     
     # Create job configuration
     job_config = AfJobConfig(
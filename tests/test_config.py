@@ -80,3 +80,24 @@ def test_af_job_config():
             sequences=[],  # Empty sequences should raise error
             dialect=Dialect.ALPHAFOLD3
         )
+
+
+def test_dump_json():
+    """Test streaming JSON dump matches to_dict output."""
+    import io
+    import json
+
+    seq = ProteinSequence(id="seq1", sequence="ACDEFG")
+    job_config = AfJobConfig(
+        name="test_job",
+        modelSeeds=[1],
+        sequences=[seq],
+        dialect=Dialect.ALPHAFOLD3,
+        version=Version.V1,
+        userCCD="ccd_data"
+    )
+
+    buffer = io.StringIO()
+    job_config.dump_json(buffer)
+
+    assert json.loads(buffer.getvalue()) == job_config.to_dict()
@@ -8,7 +8,8 @@ import pytest
 
 from easyaf3config.core.config import AfJobConfig
 from easyaf3config.core.sequence import ProteinSequence
-from easyaf3config.utils.fasta import create_job_config_from_fasta, load_sequences_from_fasta
+from easyaf3config.utils.fasta import (create_job_config_from_fasta,
+                                       load_sequences_from_fasta, validate_batch)
 
 
 @pytest.fixture
@@ -42,6 +43,38 @@ def test_load_sequences_from_fasta(sample_fasta_file):
         load_sequences_from_fasta("non_existent_file.fasta")
 
 
+def test_load_sequences_from_fasta_parallel(sample_fasta_file):
+    """Test loading sequences with multiple worker processes."""
+    sequences = load_sequences_from_fasta(sample_fasta_file, workers=2)
+
+    assert len(sequences) == 2
+    assert sequences[0].id == "seq1"
+    assert sequences[0].sequence == "ACDEFGHIKL"
+    assert sequences[1].id == "seq2"
+    assert sequences[1].sequence == "MNPQRSTVWY"
+
+
+def test_load_sequences_from_fasta_mmap(sample_fasta_file):
+    """Test loading sequences via the mmap parser."""
+    sequences = load_sequences_from_fasta(sample_fasta_file, use_mmap=True)
+
+    assert len(sequences) == 2
+    assert sequences[0].id == "seq1"
+    assert sequences[0].sequence == "ACDEFGHIKL"
+    assert sequences[1].id == "seq2"
+    assert sequences[1].sequence == "MNPQRSTVWY"
+
+
+def test_validate_batch():
+    """Test batch validation of sequence bodies."""
+    # Valid bodies pass silently
+    validate_batch([b"ACDEFGHIKL", b"mnpqrstvwy"])
+
+    # Invalid character is reported with its record number
+    with pytest.raises(ValueError, match="record 2"):
+        validate_batch([b"ACDEFGHIKL", b"MNPQRSTVW1"])
+
+
 def test_create_job_config_from_fasta(sample_fasta_file):
     """Test creating a job config from a FASTA file."""
     job_config = create_job_config_from_fasta(
@@ -63,6 +63,68 @@ def test_rna_sequence():
         RNASequence(id="invalid", sequence="AUCGT")
 
 
+def test_mixed_case_sequences():
+    """Test that lowercase and mixed-case sequences are accepted."""
+    protein = ProteinSequence(id="test_protein", sequence="acdEFGhikl")
+    assert protein.sequence == "acdEFGhikl"
+
+    dna = DNASequence(id="test_dna", sequence="atcgATCG")
+    assert dna.sequence == "atcgATCG"
+
+    rna = RNASequence(id="test_rna", sequence="aucgAUCG")
+    assert rna.sequence == "aucgAUCG"
+
+
+def test_sequence_from_bytes():
+    """Test that sequences passed as bytes are validated and stored as str."""
+    protein = ProteinSequence(id="test_protein", sequence=b"ACDEFGHIKL")
+    assert protein.sequence == "ACDEFGHIKL"
+
+    with pytest.raises(ValueError):
+        ProteinSequence(id="invalid", sequence=b"ACDEFGHIKLZ")
+
+
+def test_mixed_modifications_rejected():
+    """Test that a list mixing Modification objects and dicts is rejected."""
+    with pytest.raises(TypeError):
+        ProteinSequence(
+            id="mixed",
+            sequence="ACDEFGHIKL",
+            modifications=[
+                Modification(ptmType="phosphorylation", ptmPosition=1),
+                {"ptmType": "acetylation", "ptmPosition": 5}
+            ]
+        )
+
+    # Dict-first mixed lists are still fully converted
+    protein = ProteinSequence(
+        id="mixed",
+        sequence="ACDEFGHIKL",
+        modifications=[
+            {"ptmType": "acetylation", "ptmPosition": 5},
+            Modification(ptmType="phosphorylation", ptmPosition=1)
+        ]
+    )
+    assert all(isinstance(mod, Modification) for mod in protein.modifications)
+
+
+def test_deferred_validation():
+    """Test skipping validation at construction and running it explicitly."""
+    # Invalid residues are accepted when validation is deferred
+    protein = ProteinSequence(id="trusted", sequence="ACDEFGHIKLZ", validate=False)
+    assert protein.sequence == "ACDEFGHIKLZ"
+
+    # Explicit validation still catches them
+    with pytest.raises(ValueError):
+        protein.validate_sequence()
+
+
+def test_to_dict_is_cached():
+    """Test that repeated to_dict calls reuse the cached result."""
+    protein = ProteinSequence(id="test_protein", sequence="ACDEFGHIKL")
+    assert protein.to_dict() is protein.to_dict()
+
+
 def test_sequence_with_modifications():
     """Test Sequence with modifications."""
     mods = [